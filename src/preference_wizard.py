@@ -7,15 +7,16 @@ Validates input and handles default values appropriately.
 
 import logging
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class UserPreferences:
-    """User search preferences collected from wizard"""
+    """User search preferences collected from wizard (immutable once collected)"""
     wanted_keywords: List[str]
     reject_keywords: List[str]
     remote_preference: str  # 'yes', 'no', 'any'
@@ -26,6 +27,23 @@ class UserPreferences:
     resume_skills: List[str]
 
 
+@lru_cache(maxsize=4096)
+def _parse_keyword_line(raw: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated keyword line into lowercase, stripped keywords.
+    
+    Pure and memoized, so repeated entries of the same line are parsed once.
+    Returns a tuple so cached results cannot be mutated by callers.
+    
+    Args:
+        raw: Raw user input line
+        
+    Returns:
+        Tuple of non-empty keywords in input order
+    """
+    return tuple(kw for kw in (part.strip().lower() for part in raw.split(',')) if kw)
+
+
 class PreferenceWizard:
     """
     Interactive CLI wizard for collecting user search preferences.
@@ -133,7 +151,7 @@ class PreferenceWizard:
                         continue
                 
                 # Parse comma-separated values
-                keywords = [kw.strip().lower() for kw in user_input.split(',') if kw.strip()]
+                keywords = list(_parse_keyword_line(user_input))
                 
                 if not keywords and not allow_empty:
                     print("Error: This field cannot be empty. Please enter at least one keyword.")
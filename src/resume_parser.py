@@ -49,6 +49,7 @@ class ResumeParser:
         logger.info(f"Initializing ResumeParser with model: {model_name}")
         self.model = SentenceTransformer(model_name)
         self.skill_library = SkillLibrary.get_all_skills()
+        self.skill_library_set = frozenset(self.skill_library)  # O(1) membership checks
         logger.info(f"Loaded {len(self.skill_library)} skills from library")
     
     def extract_text_from_pdf(self, pdf_path: Path) -> str:
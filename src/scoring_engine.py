@@ -7,9 +7,11 @@ location matching, and reject keyword filtering.
 """
 
 import re
+import heapq
 import logging
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from operator import attrgetter
+from typing import List, Dict, Optional, Pattern, Tuple
 
 from .scrapers.base_scraper import JobListing
 from .preference_wizard import UserPreferences
@@ -102,6 +104,15 @@ class ScoringEngine:
             re.IGNORECASE
         )
         
+        # Compile word-boundary patterns once per engine instead of per listing
+        self._reject_patterns = self._compile_terms(self.expanded_reject_keywords)
+        self._keyword_patterns = self._compile_terms(self.expanded_keywords)
+        self._skill_patterns = self._compile_terms(preferences.resume_skills)
+        
+        # Preferences are immutable, so per-listing numeric checks read plain attributes
+        self._wants_remote = preferences.remote_preference == 'yes'
+        self._min_stipend = preferences.min_stipend
+        
         logger.info(f"Initialized ScoringEngine with {len(preferences.wanted_keywords)} wanted keywords "
                    f"(expanded to {len(self.expanded_keywords)}), "
                    f"{len(preferences.reject_keywords)} reject keywords")
@@ -134,6 +145,45 @@ class ScoringEngine:
         
         return list(set(expanded))  # Remove duplicates
     
+    @staticmethod
+    def _compile_terms(terms: List[str]) -> List[Tuple[str, Pattern]]:
+        """
+        Compile a lowercase word-boundary pattern for each term.
+        
+        Args:
+            terms: Keywords or skills to match
+            
+        Returns:
+            List of (lowercase term, compiled pattern) pairs, in input order
+        """
+        compiled = []
+        for term in terms:
+            term_lower = term.lower()
+            # Word boundaries avoid partial matches,
+            # e.g. "ai" won't match "email" and "hr" won't match "three"
+            compiled.append((term_lower, re.compile(r'\b' + re.escape(term_lower) + r'\b')))
+        return compiled
+    
+    @staticmethod
+    def _matching_terms(patterns: List[Tuple[str, Pattern]], searchable_text: str) -> List[str]:
+        """
+        Return the terms whose word-boundary pattern matches the text.
+        
+        A word-boundary match implies a plain substring match, so the cheap
+        substring check skips the regex for terms that cannot match.
+        
+        Args:
+            patterns: Output of _compile_terms
+            searchable_text: Lowercased text to search
+            
+        Returns:
+            List[str]: Matching terms, in pattern order
+        """
+        return [
+            term for term, pattern in patterns
+            if term in searchable_text and pattern.search(searchable_text)
+        ]
+    
     def score_listing(self, listing: JobListing) -> Optional[ScoredListing]:
         """
         Score a single listing based on preferences.
@@ -146,8 +196,11 @@ class ScoringEngine:
         Returns:
             Optional[ScoredListing]: Scored listing or None if rejected
         """
+        # Lowercased title + description, cached on the listing at construction
+        searchable_text = listing.search_text
+        
         # Check reject keywords first
-        if self._check_reject_keywords(listing):
+        if self._check_reject_keywords(listing, searchable_text):
             logger.debug(f"Listing rejected due to reject keyword: {listing.title}")
             return None
         
@@ -155,14 +208,14 @@ class ScoringEngine:
         # The stipend will still be displayed in the dashboard
         
         # Calculate score components
-        keyword_score = self._score_keywords(listing)
+        keyword_score = self._score_keywords(listing, searchable_text)
         
         # IMPORTANT: Reject if zero keyword matches when keywords are specified
         # This prevents completely irrelevant listings from appearing
         if self.preferences.wanted_keywords and keyword_score == 0:
             logger.debug(f"Listing rejected due to zero keyword matches: {listing.title}")
             return None
-        skill_score = self._score_skills(listing)
+        skill_score = self._score_skills(listing, searchable_text)
         stipend_score = self._score_stipend(listing)
         remote_score = self._score_remote(listing)
         location_score = self._score_location(listing)
@@ -179,9 +232,11 @@ class ScoringEngine:
             'location': location_score
         }
         
-        logger.debug(f"Scored listing: {listing.title} - Total: {total_score:.1f} "
-                    f"(kw:{keyword_score}, sk:{skill_score}, st:{stipend_score:.1f}, "
-                    f"rm:{remote_score}, loc:{location_score})")
+        # Skip formatting the breakdown unless debug logging is on (runs once per listing)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Scored listing: {listing.title} - Total: {total_score:.1f} "
+                        f"(kw:{keyword_score}, sk:{skill_score}, st:{stipend_score:.1f}, "
+                        f"rm:{remote_score}, loc:{location_score})")
         
         return ScoredListing(
             listing=listing,
@@ -189,93 +244,93 @@ class ScoringEngine:
             score_breakdown=score_breakdown
         )
     
-    def score_all(self, listings: List[JobListing], min_score: float = 0.0) -> List[ScoredListing]:
+    def score_all(self, listings: List[JobListing], min_score: float = 0.0,
+                  limit: Optional[int] = None) -> List[ScoredListing]:
         """
         Score all listings and sort by score in descending order.
         
         Args:
             listings: List of JobListing objects to score
             min_score: Minimum score threshold (default: 0.0 - show all)
+            limit: Keep only the top N listings (default: None - keep all).
+                Leave unset when deduplicating afterwards, since duplicates
+                removed later would leave fewer than N results.
             
         Returns:
             List[ScoredListing]: Scored listings sorted by score (highest first)
         """
         logger.info(f"Scoring {len(listings)} listings (showing all listings)")
         
-        scored_listings = []
-        rejected_count = 0
-        
-        for listing in listings:
-            scored = self.score_listing(listing)
-            if scored is None:
-                rejected_count += 1
-            else:
-                scored_listings.append(scored)
+        score_listing = self.score_listing
+        scored_listings = [
+            scored for scored in map(score_listing, listings)
+            if scored is not None
+        ]
+        rejected_count = len(listings) - len(scored_listings)
         
-        # Sort by score in descending order
-        scored_listings.sort(key=lambda x: x.score, reverse=True)
+        # Sort by score in descending order (stable, so ties keep scrape order)
+        if limit is not None and limit < len(scored_listings):
+            # Partial selection: O(N log k), same result as sort-then-slice
+            scored_listings = heapq.nlargest(limit, scored_listings, key=attrgetter('score'))
+        else:
+            scored_listings.sort(key=attrgetter('score'), reverse=True)
         
         logger.info(f"Scored {len(scored_listings)} listings, rejected {rejected_count} (reject keywords only)")
         
         return scored_listings
     
-    def _check_reject_keywords(self, listing: JobListing) -> bool:
+    def filter_rejected(self, listings: List[JobListing]) -> List[JobListing]:
+        """
+        Drop listings that contain a reject keyword, without scoring the rest.
+        
+        Args:
+            listings: List of JobListing objects to filter
+            
+        Returns:
+            List[JobListing]: Listings with no reject keyword match, in input order
+        """
+        check_reject = self._check_reject_keywords
+        return [
+            listing for listing in listings
+            if not check_reject(listing, listing.search_text)
+        ]
+    
+    def _check_reject_keywords(self, listing: JobListing, searchable_text: str) -> bool:
         """
         Check if listing contains any reject keywords using word boundary matching.
         Uses expanded keywords (e.g., 'ml' checks for both 'ml' and 'machine learning').
         
         Args:
             listing: JobListing to check
+            searchable_text: Lowercased title and description
             
         Returns:
             bool: True if listing should be rejected, False otherwise
         """
-        if not self.expanded_reject_keywords:
-            return False
-        
-        # Combine title and description for searching
-        searchable_text = f"{listing.title} {listing.description}".lower()
-        
-        # Check each expanded reject keyword with word boundary matching
-        import re
-        for keyword in self.expanded_reject_keywords:
-            # Use word boundary regex to avoid partial matches
-            # e.g., "hr" won't match "three" or "through"
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            if re.search(pattern, searchable_text):
-                logger.debug(f"Reject keyword '{keyword}' found in: {listing.title}")
-                return True
-        
-        return False
+        # Stop at the first hit; one reject keyword is enough
+        return any(
+            keyword in searchable_text and pattern.search(searchable_text)
+            for keyword, pattern in self._reject_patterns
+        )
     
-    def _score_keywords(self, listing: JobListing) -> float:
+    def _score_keywords(self, listing: JobListing, searchable_text: str) -> float:
         """
         Score based on wanted keyword matches (10 points per match) using word boundary matching.
         Uses expanded keywords (e.g., 'ml' checks for both 'ml' and 'machine learning').
         
         Args:
             listing: JobListing to score
+            searchable_text: Lowercased title and description
             
         Returns:
             float: Keyword score
         """
-        if not self.expanded_keywords:
+        if not self._keyword_patterns:
             return 0.0
         
-        # Combine title and description for searching
-        searchable_text = f"{listing.title} {listing.description}".lower()
-        
         # Count keyword matches with word boundary matching
-        import re
-        matches = 0
-        matched_keywords = []
-        for keyword in self.expanded_keywords:
-            # Use word boundary regex for more accurate matching
-            # This prevents "ai" from matching "email" or "said"
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            if re.search(pattern, searchable_text):
-                matches += 1
-                matched_keywords.append(keyword)
+        matched_keywords = self._matching_terms(self._keyword_patterns, searchable_text)
+        matches = len(matched_keywords)
         
         score = matches * 10.0  # 10 points per keyword match
         
@@ -284,29 +339,22 @@ class ScoringEngine:
         
         return score
     
-    def _score_skills(self, listing: JobListing) -> float:
+    def _score_skills(self, listing: JobListing, searchable_text: str) -> float:
         """
         Score based on resume skill matches (3 points per match).
         
         Args:
             listing: JobListing to score
+            searchable_text: Lowercased title and description
             
         Returns:
             float: Skill score
         """
-        if not self.preferences.resume_skills:
+        if not self._skill_patterns:
             return 0.0
         
-        # Combine title and description for searching
-        searchable_text = f"{listing.title} {listing.description}".lower()
-        
-        # Count skill matches
-        matches = 0
-        for skill in self.preferences.resume_skills:
-            # Use word boundary regex for more accurate matching
-            skill_pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(skill_pattern, searchable_text):
-                matches += 1
+        # Count skill matches with word boundary matching
+        matches = len(self._matching_terms(self._skill_patterns, searchable_text))
         
         score = matches * 3.0  # Increased from 1.0 to 3.0
         
@@ -327,17 +375,19 @@ class ScoringEngine:
         Returns:
             float: Stipend score (0-3 points)
         """
-        if listing.stipend is None:
+        stipend = listing.stipend
+        if stipend is None:
             return 0.0
         
-        if listing.stipend <= self.preferences.min_stipend:
+        if stipend <= self._min_stipend:
             return 0.0
         
         # Calculate proportional score (reduced max from 5 to 3)
-        stipend_above_min = listing.stipend - self.preferences.min_stipend
+        stipend_above_min = stipend - self._min_stipend
         score = min(stipend_above_min / 10000.0, 3.0)
         
-        logger.debug(f"Stipend score for '{listing.title}': ₹{listing.stipend} -> {score:.2f} points")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Stipend score for '{listing.title}': ₹{listing.stipend} -> {score:.2f} points")
         
         return score
     
@@ -354,18 +404,29 @@ class ScoringEngine:
             float: Remote score (0 or 5 points)
         """
         # Only score if user wants remote work
-        if self.preferences.remote_preference != 'yes':
+        if not self._wants_remote:
             return 0.0
         
-        # Check location and description for remote indicators
-        searchable_text = f"{listing.location} {listing.description}".lower()
-        
-        if self.remote_regex.search(searchable_text):
+        if self._detect_remote(listing.location, listing.description):
             logger.debug(f"Remote work detected for '{listing.title}'")
             return 5.0
         
         return 0.0
     
+    def _detect_remote(self, location: str, description: str) -> bool:
+        """
+        Check location and description for remote work indicators.
+        
+        Args:
+            location: Listing location
+            description: Listing description
+            
+        Returns:
+            bool: True if any remote pattern matches
+        """
+        searchable_text = f"{location} {description}".lower()
+        return self.remote_regex.search(searchable_text) is not None
+    
     def _score_location(self, listing: JobListing) -> float:
         """
         Score based on location match (5 points for match).
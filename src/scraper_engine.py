@@ -133,6 +133,7 @@ class ScraperEngine:
         Scrape a single platform with error isolation.
         
         This method ensures that exceptions from one platform don't affect others.
+        A scraper may also return None to report failure without raising.
         
         Args:
             scraper: Platform-specific scraper instance
@@ -147,6 +148,15 @@ class ScraperEngine:
             logger.debug(f"Starting scraping for {platform_name}...")
             listings = scraper.scrape(preferences)
             
+            if listings is None:
+                logger.error(f"Error scraping {platform_name}: scraper returned no result")
+                return ScrapingResult(
+                    platform=platform_name,
+                    listings=[],
+                    success=False,
+                    error_message="Scraper returned no result"
+                )
+            
             return ScrapingResult(
                 platform=platform_name,
                 listings=listings,
@@ -22,9 +22,15 @@ from ..logging_config import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class JobListing:
-    """Represents a single internship listing"""
+    """Represents a single internship listing (immutable; use dataclasses.replace to derive)"""
+    # Declared by hand rather than slots=True, which needs Python 3.10+
+    __slots__ = (
+        'title', 'company', 'stipend', 'location', 'description', 'url',
+        'posted_date', 'source_platform', 'raw_stipend_text', 'search_text',
+    )
+
     title: str
     company: str
     stipend: Optional[int]  # In INR, None if unpaid/not specified
@@ -34,6 +40,20 @@ class JobListing:
     posted_date: Optional[str]
     source_platform: str
     raw_stipend_text: str  # Original text like "₹15,000-20,000/month"
+    # search_text (see __slots__) is the lowercased "title description",
+    # computed once for keyword/skill matching; it is not a dataclass field
+    
+    def __post_init__(self):
+        # Frozen dataclass: bypass __setattr__ to fill the derived slot
+        object.__setattr__(self, 'search_text', f"{self.title} {self.description}".lower())
+
+    # copy/pickle restore slots with setattr, which the frozen class rejects
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 class BaseScraper(ABC):
@@ -152,6 +172,21 @@ class BaseScraper(ABC):
         
         return None
     
+    def _parse_html(self, html: str) -> BeautifulSoup:
+        """
+        Parse a fetched page into a BeautifulSoup tree.
+        
+        Static scrapers parse every page through this method, so tests can
+        substitute pre-parsed trees for their HTML fixtures.
+        
+        Args:
+            html: Page HTML
+            
+        Returns:
+            BeautifulSoup: Parsed page
+        """
+        return BeautifulSoup(html, 'html.parser')
+    
     def _parse_stipend(self, stipend_text: str) -> Optional[int]:
         """
         Parse stipend from text to integer value in INR.
@@ -215,7 +250,7 @@ class BaseScraper(ABC):
         return min_stipend
     
     @abstractmethod
-    def scrape(self, preferences) -> List[JobListing]:
+    def scrape(self, preferences) -> Optional[List[JobListing]]:
         """
         Scrape listings from the platform.
         
@@ -225,7 +260,8 @@ class BaseScraper(ABC):
             preferences: UserPreferences object with search criteria
             
         Returns:
-            List[JobListing]: List of scraped job listings
+            Optional[List[JobListing]]: List of scraped job listings, or None
+            if the scrape failed (ScraperEngine reports the platform as failed)
         """
         pass
     
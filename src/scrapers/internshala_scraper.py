@@ -57,7 +57,7 @@ class InternshalaScr(BaseScraper):
                     continue
                 
                 # Parse HTML
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._parse_html(response.text)
                 
                 # Try multiple selector strategies
                 internship_cards = self._find_internship_cards(soup)
@@ -5,7 +5,6 @@ Scrapes internship listings from InternWorld.in
 """
 
 from typing import List
-from bs4 import BeautifulSoup
 
 from .base_scraper import BaseScraper, JobListing
 from ..logging_config import get_logger
@@ -45,7 +44,7 @@ class InternWorldScraper(BaseScraper):
                 return listings
             
             # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._parse_html(response.text)
             
             # Find internship listings
             internship_cards = soup.find_all('div', class_='listing')
@@ -66,7 +66,7 @@ class LetsInternScraper(BaseScraper):
                     continue
                 
                 # Parse HTML
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._parse_html(response.text)
                 
                 # Find internship cards with multiple strategies
                 internship_cards = self._find_internship_cards(soup)
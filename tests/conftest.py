@@ -0,0 +1,153 @@
+"""
+Shared pytest fixtures and configuration for the InternHunt test suite.
+"""
+
+import dataclasses
+import os
+from collections import OrderedDict
+from functools import lru_cache
+
+import pytest
+from hypothesis import HealthCheck, settings
+
+
+# "fast" drops the on-disk example database and deadlines for CI runs where
+# .hypothesis/ is not persisted; select it with HYPOTHESIS_PROFILE=fast
+settings.register_profile("fast", database=None, deadline=None)
+# "ci" runs a quarter of the default examples from a fixed seed, so CI results are
+# reproducible; applies to property tests that don't pin max_examples themselves.
+# A seeded run gains nothing from replaying saved examples, so it skips the database,
+# and shared CI runners are too noisy for the input-generation speed check
+settings.register_profile(
+    "ci", max_examples=25, derandomize=True, deadline=None, database=None,
+    suppress_health_check=[HealthCheck.too_slow]
+)
+# pytest-xdist workers compete for CPU, which can trip the input-generation speed
+# health check; "parallel" relaxes it and is the default on xdist workers
+settings.register_profile("parallel", suppress_health_check=[HealthCheck.too_slow])
+_DEFAULT_PROFILE = "parallel" if os.getenv("PYTEST_XDIST_WORKER") else "default"
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", _DEFAULT_PROFILE))
+
+# Property tests draw many distinct preferences; keep only the most recent engines
+_ENGINE_CACHE_SIZE = 256
+_LISTING_CACHE_SIZE = 1024
+
+
+def pytest_configure(config):
+    """Register the xdist_group marker so it is known even without pytest-xdist"""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): pin tests to one pytest-xdist worker under --dist loadgroup"
+    )
+    config.addinivalue_line(
+        "markers",
+        "hypothesis_slow: property tests that run a thread pool per example; spread them across xdist workers"
+    )
+
+
+@pytest.fixture(scope="session")
+def resume_parser():
+    """
+    Session-wide ResumeParser instance.
+    
+    Loading the SentenceTransformer model dominates parser setup, so every
+    resume parser test in a worker shares this one instance.
+    """
+    from src.resume_parser import ResumeParser
+    return ResumeParser()
+
+
+@pytest.fixture(scope="session")
+def parse_html_fixture():
+    """
+    Session-wide memoized parse of HTML fixtures into BeautifulSoup trees.
+    
+    Scrapers only read the tree, and the paginating scrapers fetch the same
+    mocked page repeatedly, so each fixture is parsed once per session, on
+    first use, and patched in place of BaseScraper._parse_html.
+    """
+    from bs4 import BeautifulSoup
+    
+    @lru_cache(maxsize=None)
+    def _parse(html):
+        return BeautifulSoup(html, 'html.parser')
+    
+    return _parse
+
+
+@pytest.fixture(scope="session")
+def make_prefs():
+    """Factory for UserPreferences that overrides fields of a shared template"""
+    from src.preference_wizard import UserPreferences
+    
+    template = UserPreferences(
+        wanted_keywords=[],
+        reject_keywords=[],
+        remote_preference='any',
+        min_stipend=0,
+        max_post_age_days=30,
+        max_results=50,
+        preferred_locations=[],
+        resume_skills=[]
+    )
+    
+    def _make(**overrides):
+        return dataclasses.replace(template, **overrides)
+    
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_listing():
+    """Factory for JobListing that overrides fields of a shared template"""
+    from src.scrapers.base_scraper import JobListing
+    
+    template = JobListing(
+        title="Developer Intern",
+        company="Tech Corp",
+        stipend=15000,
+        location="Bangalore",
+        description="Office based role",
+        url="http://test.com",
+        posted_date="2024-01-01",
+        source_platform="Test",
+        raw_stipend_text="15000"
+    )
+    
+    def _make(**overrides):
+        return dataclasses.replace(template, **overrides)
+    
+    return _make
+
+
+@pytest.fixture(scope="session")
+def scoring_engine_for():
+    """
+    Session-wide LRU cache of ScoringEngine instances keyed by preference values.
+    
+    Engines are read-only once built, so tests (and Hypothesis replays of an
+    example) with identical preferences reuse one instance instead of
+    repeating keyword expansion and regex setup.
+    """
+    from src.scoring_engine import ScoringEngine
+    
+    cache = OrderedDict()
+    
+    def _engine_for(preferences):
+        key = tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(preferences, f.name) for f in dataclasses.fields(preferences))
+        )
+        engine = cache.get(key)
+        if engine is None:
+            engine = cache[key] = ScoringEngine(preferences)
+            # JobListing is frozen and hashable, so Hypothesis replays of the same
+            # listing reuse the earlier result; score_all goes through this too
+            engine.score_listing = lru_cache(maxsize=_LISTING_CACHE_SIZE)(engine.score_listing)
+            if len(cache) > _ENGINE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return engine
+    
+    return _engine_for
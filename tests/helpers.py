@@ -0,0 +1,18 @@
+"""
+Shared helpers for the InternHunt test suite.
+"""
+
+
+class OutputFlag:
+    """Stdout sink that only records whether needle was printed (case-insensitive)"""
+    __slots__ = ('hit', 'needle')
+    
+    def __init__(self, needle):
+        self.hit = False
+        self.needle = needle
+    
+    def write(self, s):
+        self.hit = self.hit or (self.needle in s.lower())
+    
+    def flush(self):
+        pass
@@ -6,77 +6,101 @@ Tests keyword parsing, default value handling, and empty input handling.
 
 import pytest
 from unittest.mock import patch, MagicMock
-from io import StringIO
 
 from src.preference_wizard import PreferenceWizard, UserPreferences
+from helpers import OutputFlag
+
+
+# Wizard tests are cheap and independent; run them as one group under --dist loadgroup
+pytestmark = pytest.mark.xdist_group(name="wizard")
+
+
+class _NullSink:
+    """Stdout sink that discards everything, for tests that ignore output"""
+    
+    def write(self, s):
+        pass
+    
+    def flush(self):
+        pass
+
+
+_NULL_SINK = _NullSink()
+
+
+@pytest.fixture(scope="module")
+def wizard():
+    """Shared wizard instance; PreferenceWizard holds no per-run state"""
+    return PreferenceWizard()
 
 
 class TestKeywordParsing:
     """Test keyword parsing with comma-separated values (Requirements 2.1, 2.2)"""
     
-    def test_single_keyword(self):
+    def test_single_keyword(self, wizard):
         """Test parsing a single keyword"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value='python'):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': 'python')
             result = wizard._prompt_keywords("Enter keywords: ")
             
         assert result == ['python']
     
-    def test_multiple_keywords(self):
+    def test_multiple_keywords(self, wizard):
         """Test parsing multiple comma-separated keywords"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value='python, java, javascript'):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': 'python, java, javascript')
             result = wizard._prompt_keywords("Enter keywords: ")
             
         assert result == ['python', 'java', 'javascript']
     
-    def test_keywords_with_extra_spaces(self):
+    def test_keywords_with_extra_spaces(self, wizard):
         """Test parsing keywords with extra whitespace"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value='  python  ,  java  ,  javascript  '):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': '  python  ,  java  ,  javascript  ')
             result = wizard._prompt_keywords("Enter keywords: ")
             
         assert result == ['python', 'java', 'javascript']
     
-    def test_keywords_case_normalization(self):
+    def test_keywords_case_normalization(self, wizard):
         """Test that keywords are converted to lowercase"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value='Python, JAVA, JavaScript'):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': 'Python, JAVA, JavaScript')
             result = wizard._prompt_keywords("Enter keywords: ")
             
         assert result == ['python', 'java', 'javascript']
     
-    def test_empty_keywords_rejected_when_required(self):
+    def test_empty_keywords_rejected_when_required(self, wizard):
         """Test that empty input is rejected when keywords are required"""
-        wizard = PreferenceWizard()
         
         # First input is empty, second is valid
-        with patch('builtins.input', side_effect=['', 'python']):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                result = wizard._prompt_keywords("Enter keywords: ", allow_empty=False)
+        inputs = iter(['', 'python'])
+        sink = OutputFlag('empty')
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': next(inputs))
+            mp.setattr('sys.stdout', sink)
+            result = wizard._prompt_keywords("Enter keywords: ", allow_empty=False)
                 
         assert result == ['python']
-        output = mock_stdout.getvalue()
-        assert 'Error' in output or 'empty' in output.lower()
+        assert sink.hit
     
-    def test_empty_keywords_accepted_when_optional(self):
+    def test_empty_keywords_accepted_when_optional(self, wizard):
         """Test that empty input is accepted when keywords are optional"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value=''):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': '')
             result = wizard._prompt_keywords("Enter keywords: ", allow_empty=True)
             
         assert result == []
     
-    def test_keywords_with_trailing_commas(self):
+    def test_keywords_with_trailing_commas(self, wizard):
         """Test parsing keywords with trailing commas"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value='python, java,'):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': 'python, java,')
             result = wizard._prompt_keywords("Enter keywords: ")
             
         assert result == ['python', 'java']
@@ -85,38 +109,38 @@ class TestKeywordParsing:
 class TestDefaultValueHandling:
     """Test default value handling for integer prompts (Requirements 2.6, 2.7)"""
     
-    def test_empty_input_uses_default_stipend(self):
+    def test_empty_input_uses_default_stipend(self, wizard):
         """Test that empty input uses default value for stipend"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value=''):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': '')
             result = wizard._prompt_integer("Enter stipend: ", default=0, min_val=0)
             
         assert result == 0
     
-    def test_empty_input_uses_default_max_results(self):
+    def test_empty_input_uses_default_max_results(self, wizard):
         """Test that empty input uses default value for max results"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value=''):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': '')
             result = wizard._prompt_integer("Enter max results: ", default=50, min_val=1)
             
         assert result == 50
     
-    def test_empty_input_uses_default_post_age(self):
+    def test_empty_input_uses_default_post_age(self, wizard):
         """Test that empty input uses default value for post age"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value=''):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': '')
             result = wizard._prompt_integer("Enter post age: ", default=30, min_val=1)
             
         assert result == 30
     
-    def test_explicit_value_overrides_default(self):
+    def test_explicit_value_overrides_default(self, wizard):
         """Test that explicit value overrides default"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value='100'):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': '100')
             result = wizard._prompt_integer("Enter value: ", default=50, min_val=0)
             
         assert result == 100
@@ -125,29 +149,29 @@ class TestDefaultValueHandling:
 class TestEmptyInputHandling:
     """Test empty input handling for optional fields (Requirements 2.7)"""
     
-    def test_empty_reject_keywords(self):
+    def test_empty_reject_keywords(self, wizard):
         """Test that empty reject keywords are accepted"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value=''):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': '')
             result = wizard._prompt_keywords("Enter reject keywords: ", allow_empty=True)
             
         assert result == []
     
-    def test_empty_preferred_locations(self):
+    def test_empty_preferred_locations(self, wizard):
         """Test that empty preferred locations are accepted"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value=''):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': '')
             result = wizard._prompt_keywords("Enter locations: ", allow_empty=True)
             
         assert result == []
     
-    def test_whitespace_only_treated_as_empty(self):
+    def test_whitespace_only_treated_as_empty(self, wizard):
         """Test that whitespace-only input is treated as empty"""
-        wizard = PreferenceWizard()
         
-        with patch('builtins.input', return_value='   '):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('builtins.input', lambda _='': '   ')
             result = wizard._prompt_keywords("Enter keywords: ", allow_empty=True)
             
         assert result == []
@@ -156,36 +180,32 @@ class TestEmptyInputHandling:
 class TestRemotePreference:
     """Test remote preference validation (Requirements 2.3)"""
     
-    def test_yes_accepted(self):
+    def test_yes_accepted(self, wizard):
         """Test that 'yes' is accepted"""
-        wizard = PreferenceWizard()
         
         with patch('builtins.input', return_value='yes'):
             result = wizard._prompt_remote_preference()
             
         assert result == 'yes'
     
-    def test_no_accepted(self):
+    def test_no_accepted(self, wizard):
         """Test that 'no' is accepted"""
-        wizard = PreferenceWizard()
         
         with patch('builtins.input', return_value='no'):
             result = wizard._prompt_remote_preference()
             
         assert result == 'no'
     
-    def test_any_accepted(self):
+    def test_any_accepted(self, wizard):
         """Test that 'any' is accepted"""
-        wizard = PreferenceWizard()
         
         with patch('builtins.input', return_value='any'):
             result = wizard._prompt_remote_preference()
             
         assert result == 'any'
     
-    def test_case_insensitive(self):
+    def test_case_insensitive(self, wizard):
         """Test that remote preference is case-insensitive"""
-        wizard = PreferenceWizard()
         
         with patch('builtins.input', return_value='YES'):
             result = wizard._prompt_remote_preference()
@@ -196,119 +216,97 @@ class TestRemotePreference:
 class TestIntegerValidation:
     """Test integer validation (Requirements 2.4, 2.5, 2.6)"""
     
-    def test_valid_positive_integer(self):
+    def test_valid_positive_integer(self, wizard):
         """Test that valid positive integers are accepted"""
-        wizard = PreferenceWizard()
         
         with patch('builtins.input', return_value='100'):
             result = wizard._prompt_integer("Enter value: ", default=50, min_val=1)
             
         assert result == 100
     
-    def test_zero_accepted_for_stipend(self):
+    def test_zero_accepted_for_stipend(self, wizard):
         """Test that zero is accepted for stipend (min_val=0)"""
-        wizard = PreferenceWizard()
         
         with patch('builtins.input', return_value='0'):
             result = wizard._prompt_integer("Enter stipend: ", default=0, min_val=0)
             
         assert result == 0
     
-    def test_negative_rejected_for_stipend(self):
+    def test_negative_rejected_for_stipend(self, wizard):
         """Test that negative values are rejected for stipend"""
-        wizard = PreferenceWizard()
         
         with patch('builtins.input', side_effect=['-100', '0']):
-            with patch('sys.stdout', new_callable=StringIO):
+            with patch('sys.stdout', _NULL_SINK):
                 result = wizard._prompt_integer("Enter stipend: ", default=0, min_val=0)
                 
         assert result == 0
     
-    def test_zero_rejected_for_positive_fields(self):
+    def test_zero_rejected_for_positive_fields(self, wizard):
         """Test that zero is rejected for fields requiring positive values"""
-        wizard = PreferenceWizard()
         
         with patch('builtins.input', side_effect=['0', '30']):
-            with patch('sys.stdout', new_callable=StringIO):
+            with patch('sys.stdout', _NULL_SINK):
                 result = wizard._prompt_integer("Enter post age: ", default=30, min_val=1)
                 
         assert result == 30
 
 
+_ALL_INPUTS = (
+    'python, machine learning',  # wanted keywords
+    'sales, marketing',          # reject keywords
+    # remote preference removed - now hardcoded to 'any'
+    # min stipend removed - now hardcoded to 0
+    '30',                         # max post age
+    '50',                         # max results
+    # preferred locations removed - now hardcoded to []
+)
+
+_DEFAULT_INPUTS = (
+    'python',  # wanted keywords
+    '',        # reject keywords (empty)
+    'any',     # max post age (invalid, re-prompted)
+    '',        # max post age (default 30)
+    '',        # max results (default 100)
+    '',        # unused (location prompt removed)
+    '',        # unused
+)
+
+_EXPECTED_ALL = {
+    'wanted_keywords': ['python', 'machine learning'],
+    'reject_keywords': ['sales', 'marketing'],
+    'remote_preference': 'any',  # Always 'any' now
+    'min_stipend': 0,  # Always 0 now
+    'max_post_age_days': 30,
+    'max_results': 50,
+    'preferred_locations': [],  # Always empty now
+    'resume_skills': ['python', 'java'],
+}
+
+_EXPECTED_DEFAULTS = {
+    'wanted_keywords': ['python'],
+    'reject_keywords': [],
+    'remote_preference': 'any',
+    'min_stipend': 0,
+    'max_post_age_days': 30,
+    'max_results': 100,  # Updated default from 50 to 100
+    'preferred_locations': [],
+    'resume_skills': [],
+}
+
+
 class TestFullWizard:
     """Test complete wizard flow"""
     
-    def test_run_wizard_with_all_inputs(self):
-        """Test running the full wizard with all inputs provided"""
-        wizard = PreferenceWizard()
-        
-        inputs = [
-            'python, machine learning',  # wanted keywords
-            'sales, marketing',          # reject keywords
-            # remote preference removed - now hardcoded to 'any'
-            # min stipend removed - now hardcoded to 0
-            '30',                         # max post age
-            '50',                         # max results
-            # preferred locations removed - now hardcoded to []
-        ]
-        
-        with patch('builtins.input', side_effect=inputs):
-            with patch('sys.stdout', new_callable=StringIO):
-                result = wizard.run_wizard(resume_skills=['python', 'java'])
+    @pytest.mark.parametrize("inputs,wizard_kwargs,expected", [
+        pytest.param(_ALL_INPUTS, {'resume_skills': ['python', 'java']}, _EXPECTED_ALL, id="all_inputs"),
+        pytest.param(_DEFAULT_INPUTS, {}, _EXPECTED_DEFAULTS, id="defaults"),
+        pytest.param(_DEFAULT_INPUTS, {'resume_skills': None}, _EXPECTED_DEFAULTS, id="without_resume_skills"),
+    ])
+    def test_run_wizard(self, wizard, inputs, wizard_kwargs, expected):
+        """Test running the full wizard with all inputs, defaults, and no resume skills"""
+        with patch('builtins.input', side_effect=iter(inputs)):
+            with patch('sys.stdout', _NULL_SINK):
+                result = wizard.run_wizard(**wizard_kwargs)
                 
         assert isinstance(result, UserPreferences)
-        assert result.wanted_keywords == ['python', 'machine learning']
-        assert result.reject_keywords == ['sales', 'marketing']
-        assert result.remote_preference == 'any'  # Always 'any' now
-        assert result.min_stipend == 0  # Always 0 now
-        assert result.max_post_age_days == 30
-        assert result.max_results == 50
-        assert result.preferred_locations == []  # Always empty now
-        assert result.resume_skills == ['python', 'java']
-    
-    def test_run_wizard_with_defaults(self):
-        """Test running the wizard with default values"""
-        wizard = PreferenceWizard()
-        
-        inputs = [
-            'python',  # wanted keywords
-            '',        # reject keywords (empty)
-            'any',     # remote preference
-            '',        # min stipend (default 0)
-            '',        # max post age (default 30)
-            '',        # max results (default 50)
-            ''         # preferred locations (empty)
-        ]
-        
-        with patch('builtins.input', side_effect=inputs):
-            with patch('sys.stdout', new_callable=StringIO):
-                result = wizard.run_wizard()
-                
-        assert result.wanted_keywords == ['python']
-        assert result.reject_keywords == []
-        assert result.remote_preference == 'any'
-        assert result.min_stipend == 0
-        assert result.max_post_age_days == 30
-        assert result.max_results == 100  # Updated default from 50 to 100
-        assert result.preferred_locations == []
-        assert result.resume_skills == []
-    
-    def test_run_wizard_without_resume_skills(self):
-        """Test running the wizard without resume skills"""
-        wizard = PreferenceWizard()
-        
-        inputs = [
-            'python',
-            '',
-            'any',
-            '',
-            '',
-            '',
-            ''
-        ]
-        
-        with patch('builtins.input', side_effect=inputs):
-            with patch('sys.stdout', new_callable=StringIO):
-                result = wizard.run_wizard(resume_skills=None)
-                
-        assert result.resume_skills == []
+        assert result.__dict__ == expected
@@ -6,6 +6,7 @@ Tests universal properties that should hold across all valid resume inputs.
 
 import pytest
 from hypothesis import given, strategies as st, settings
+from hypothesis.database import InMemoryExampleDatabase
 from pathlib import Path
 import tempfile
 import os
@@ -13,29 +14,27 @@ import os
 from src.resume_parser import ResumeParser, ResumeSkills
 
 
-# Reuse parser instance to avoid reloading the model for each test
-_parser_instance = None
+# Keep the heavy parser tests on one xdist worker so the model loads once
+pytestmark = pytest.mark.xdist_group(name="resume_parser")
 
 
-def get_parser():
-    """Get or create a singleton parser instance"""
-    global _parser_instance
-    if _parser_instance is None:
-        _parser_instance = ResumeParser()
-    return _parser_instance
+# Replay failing examples within a run without writing to disk
+_MEM_DB = InMemoryExampleDatabase()
+
+
+# Strategy is built once at import instead of on every decorator evaluation
+_RESUME_TEXT = st.text(
+    alphabet=st.characters(whitelist_categories=('L', 'N', 'P', 'Z')),
+    min_size=100,
+    max_size=5000
+)
 
 
 # **Feature: internhunt-v6, Property 1: Resume skill extraction bounds**
 # **Validates: Requirements 1.3**
-@settings(max_examples=100, deadline=None)
-@given(
-    resume_text=st.text(
-        alphabet=st.characters(whitelist_categories=('L', 'N', 'P', 'Z')),
-        min_size=100,
-        max_size=5000
-    )
-)
-def test_skill_extraction_bounds(resume_text):
+@settings(max_examples=100, deadline=None, database=_MEM_DB)
+@given(resume_text=_RESUME_TEXT)
+def test_skill_extraction_bounds(resume_parser, resume_text):
     """
     Property: For any valid resume text, the number of extracted skills 
     should be between 10 and 50 inclusive.
@@ -43,7 +42,7 @@ def test_skill_extraction_bounds(resume_text):
     This property ensures that the skill matching algorithm always returns
     a reasonable number of skills regardless of resume content.
     """
-    parser = get_parser()
+    parser = resume_parser
     
     # Match skills from the generated resume text
     result = parser.match_skills(resume_text)
@@ -61,14 +60,13 @@ def test_skill_extraction_bounds(resume_text):
     )
     
     # All extracted skills should be from the skill library
-    skill_library_set = set(parser.skill_library)
-    for skill in result.extracted_skills:
-        assert skill in skill_library_set, (
-            f"Skill '{skill}' not found in skill library"
-        )
+    extracted = set(result.extracted_skills)
+    assert extracted.issubset(parser.skill_library_set), (
+        f"Unknown skills: {extracted - parser.skill_library_set}"
+    )
     
     # Confidence scores should be between 0 and 1
-    for skill, score in result.confidence_scores.items():
-        assert 0 <= score <= 1, (
-            f"Confidence score for '{skill}' is {score}, expected 0-1"
-        )
+    scores = result.confidence_scores.values()
+    assert min(scores, default=0) >= 0 and max(scores, default=0) <= 1, (
+        f"Confidence scores outside 0-1: {result.confidence_scores}"
+    )
@@ -4,14 +4,88 @@ Property-Based Tests for Scoring Engine
 Tests universal properties that should hold across all inputs using Hypothesis.
 """
 
+import dataclasses
+import re
+
+import numpy as np
 import pytest
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, assume, settings, target
 
-from src.scoring_engine import ScoringEngine, ScoredListing
+from src.scoring_engine import ScoredListing, ScoringEngine
 from src.scrapers.base_scraper import JobListing
 from src.preference_wizard import UserPreferences
 
 
+# Fixed listing fields; property tests override only the fields under test
+_LISTING_TEMPLATE = JobListing(
+    title="Test Title",
+    company="Test Company",
+    stipend=10000,
+    location="Test Location",
+    description="Test description",
+    url="http://test.com",
+    posted_date="2024-01-01",
+    source_platform="Test",
+    raw_stipend_text="10000"
+)
+
+
+# Remote detection does not depend on the other preferences, so one engine serves
+_REMOTE_PREFS = UserPreferences(
+    wanted_keywords=[],
+    reject_keywords=[],
+    remote_preference='yes',
+    min_stipend=0,
+    max_post_age_days=30,
+    max_results=50,
+    preferred_locations=[],
+    resume_skills=[]
+)
+
+
+# Lowercase ASCII words that survive strip()/lower() unchanged and always match on
+# word boundaries, so tests need no assume() to discard unusable keywords
+_REJECT_KEYWORD = st.from_regex(r'[a-z0-9]{3,20}', fullmatch=True)
+_WANTED_KEYWORD = st.from_regex(r'[a-z]{3,15}', fullmatch=True)
+
+
+# Keywords with no abbreviation expansion: the engine then matches (rejects or
+# scores) a listing exactly when the keyword occurs on word boundaries
+_UNEXPANDED_REJECT_KEYWORD = _REJECT_KEYWORD.filter(
+    lambda kw: kw not in ScoringEngine.KEYWORD_EXPANSIONS
+)
+_UNEXPANDED_WANTED_KEYWORD = _WANTED_KEYWORD.filter(
+    lambda kw: kw not in ScoringEngine.KEYWORD_EXPANSIONS
+)
+
+
+# Larger than the score_all tests' lists, but small enough that generating the
+# listings does not dominate the run on every example
+_BATCH_MAX_LISTINGS = 50
+
+
+def _batch_reject_mask(listings, keyword):
+    """
+    Reference reject filter: one regex pass over all listings' text at once.
+    
+    Joins every search_text with newlines, finds the keyword on word boundaries
+    in a single scan, and maps match offsets back to listings with
+    np.searchsorted. A newline is a non-word character, so joining adds no
+    boundaries and no match can span two listings.
+    
+    Returns:
+        np.ndarray: Boolean mask, True where the listing contains the keyword
+    """
+    texts = [listing.search_text for listing in listings]
+    # Offset of each listing's text within the joined string
+    starts = np.cumsum([0] + [len(text) + 1 for text in texts[:-1]])
+    positions = [m.start() for m in re.finditer(rf'\b{re.escape(keyword)}\b', "\n".join(texts))]
+    
+    mask = np.zeros(len(texts), dtype=bool)
+    mask[np.searchsorted(starts, positions, side='right') - 1] = True
+    return mask
+
+
 # Strategy for generating job listings
 @st.composite
 def job_listing_strategy(draw):
@@ -64,6 +138,16 @@ def user_preferences_strategy(draw, wanted_kw=None, reject_kw=None, remote_pref=
     )
 
 
+# The reject tests only vary reject_keywords, set per example from the drawn keyword,
+# so they take their other preference fields from one module-level strategy
+_REJECT_TEST_PREFS = user_preferences_strategy(reject_kw=[])
+
+
+# Preferences with no wanted or reject keywords, so no listing is rejected; tests
+# that need keywords or a specific min_stipend set them with dataclasses.replace
+_NO_KEYWORD_PREFS = user_preferences_strategy(wanted_kw=[], reject_kw=[])
+
+
 class TestRejectKeywordFiltering:
     """
     Property 4: Reject keyword filtering
@@ -74,159 +158,192 @@ class TestRejectKeywordFiltering:
     Validates: Requirements 4.7
     """
     
-    @settings(max_examples=100)
     @given(
-        reject_keyword=st.text(min_size=3, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N'))),
+        reject_keyword=_REJECT_KEYWORD,
         other_text=st.text(min_size=0, max_size=100),
-        preferences_data=st.data()
+        preferences=_REJECT_TEST_PREFS
     )
-    def test_reject_keyword_in_title_excludes_listing(self, reject_keyword, other_text, preferences_data):
+    def test_reject_keyword_in_title_excludes_listing(self, scoring_engine_for, reject_keyword, other_text, preferences):
         """
         **Feature: internhunt-v6, Property 4: Reject keyword filtering**
         **Validates: Requirements 4.7**
         
         Test that listings with reject keywords in title are excluded.
         """
-        # Ensure reject keyword is not empty after normalization
-        reject_keyword = reject_keyword.strip().lower()
-        assume(len(reject_keyword) >= 3)
-        
-        # Create preferences with the reject keyword
-        preferences = preferences_data.draw(user_preferences_strategy(reject_kw=[reject_keyword]))
+        # Add the reject keyword to the drawn preferences
+        preferences = dataclasses.replace(preferences, reject_keywords=[reject_keyword])
         
         # Create listing with reject keyword in title
-        listing = JobListing(
-            title=f"{other_text} {reject_keyword} {other_text}",
-            company="Test Company",
-            stipend=10000,
-            location="Test Location",
-            description="Test description",
-            url="http://test.com",
-            posted_date="2024-01-01",
-            source_platform="Test",
-            raw_stipend_text="10000"
-        )
+        listing = dataclasses.replace(_LISTING_TEMPLATE, title=f"{other_text} {reject_keyword} {other_text}")
         
         # Score the listing
-        engine = ScoringEngine(preferences)
+        engine = scoring_engine_for(preferences)
         result = engine.score_listing(listing)
         
         # Listing should be rejected (None)
         assert result is None, f"Listing with reject keyword '{reject_keyword}' in title should be rejected"
     
-    @settings(max_examples=100)
     @given(
-        reject_keyword=st.text(min_size=3, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N'))),
+        reject_keyword=_REJECT_KEYWORD,
         other_text=st.text(min_size=0, max_size=100),
-        preferences_data=st.data()
+        preferences=_REJECT_TEST_PREFS
     )
-    def test_reject_keyword_in_description_excludes_listing(self, reject_keyword, other_text, preferences_data):
+    def test_reject_keyword_in_description_excludes_listing(self, scoring_engine_for, reject_keyword, other_text, preferences):
         """
         **Feature: internhunt-v6, Property 4: Reject keyword filtering**
         **Validates: Requirements 4.7**
         
         Test that listings with reject keywords in description are excluded.
         """
-        # Ensure reject keyword is not empty after normalization
-        reject_keyword = reject_keyword.strip().lower()
-        assume(len(reject_keyword) >= 3)
-        
-        # Create preferences with the reject keyword
-        preferences = preferences_data.draw(user_preferences_strategy(reject_kw=[reject_keyword]))
+        # Add the reject keyword to the drawn preferences
+        preferences = dataclasses.replace(preferences, reject_keywords=[reject_keyword])
         
         # Create listing with reject keyword in description
-        listing = JobListing(
-            title="Test Title",
-            company="Test Company",
-            stipend=10000,
-            location="Test Location",
-            description=f"{other_text} {reject_keyword} {other_text}",
-            url="http://test.com",
-            posted_date="2024-01-01",
-            source_platform="Test",
-            raw_stipend_text="10000"
+        listing = dataclasses.replace(
+            _LISTING_TEMPLATE, description=f"{other_text} {reject_keyword} {other_text}"
         )
         
         # Score the listing
-        engine = ScoringEngine(preferences)
+        engine = scoring_engine_for(preferences)
         result = engine.score_listing(listing)
         
         # Listing should be rejected (None)
         assert result is None, f"Listing with reject keyword '{reject_keyword}' in description should be rejected"
     
-    @settings(max_examples=100)
     @given(
         listings=st.lists(job_listing_strategy(), min_size=1, max_size=20),
-        reject_keyword=st.text(min_size=3, max_size=20, alphabet=st.characters(whitelist_categories=('L', 'N'))),
-        preferences_data=st.data()
+        reject_keyword=_REJECT_KEYWORD,
+        preferences=_REJECT_TEST_PREFS
+    )
+    def test_filter_rejected_excludes_rejected_listings(self, scoring_engine_for, listings, reject_keyword, preferences):
+        """
+        **Feature: internhunt-v6, Property 4: Reject keyword filtering**
+        **Validates: Requirements 4.7**
+        
+        Test that the reject filter drops every listing containing a reject keyword.
+        """
+        # Add the reject keyword to the drawn preferences
+        preferences = dataclasses.replace(preferences, reject_keywords=[reject_keyword])
+        
+        # Filter only; the rest of the scoring pipeline plays no part in rejection
+        engine = scoring_engine_for(preferences)
+        kept = engine.filter_rejected(listings)
+        
+        # Check that no kept listing contains the reject keyword as a whole word;
+        # compile the oracle once rather than per kept listing
+        contains_reject = re.compile(rf'\b{re.escape(reject_keyword)}\b').search
+        for listing in kept:
+            assert not contains_reject(listing.search_text), \
+                f"Kept listing should not contain reject keyword '{reject_keyword}'"
+    
+    @given(
+        listings=st.lists(job_listing_strategy(), min_size=1, max_size=20),
+        reject_keyword=_REJECT_KEYWORD,
+        planted=st.sets(st.integers(min_value=0, max_value=19)),
+        preferences=_REJECT_TEST_PREFS
     )
-    def test_score_all_excludes_rejected_listings(self, listings, reject_keyword, preferences_data):
+    def test_score_all_excludes_rejected_listings(self, scoring_engine_for, listings, reject_keyword,
+                                                  planted, preferences):
         """
         **Feature: internhunt-v6, Property 4: Reject keyword filtering**
         **Validates: Requirements 4.7**
         
         Test that score_all excludes all listings with reject keywords.
+        score_all rejects through score_listing, not filter_rejected, so this
+        covers the scoring path end to end.
         """
-        reject_keyword = reject_keyword.strip().lower()
-        assume(len(reject_keyword) >= 3)
+        # Random text rarely contains the keyword, so append it to some descriptions
+        listings = [
+            dataclasses.replace(listing, description=f"{listing.description} {reject_keyword}")
+            if i in planted else listing
+            for i, listing in enumerate(listings)
+        ]
         
-        # Create preferences with the reject keyword
-        preferences = preferences_data.draw(user_preferences_strategy(reject_kw=[reject_keyword]))
+        # Add the reject keyword to the drawn preferences
+        preferences = dataclasses.replace(preferences, reject_keywords=[reject_keyword])
         
         # Score all listings
-        engine = ScoringEngine(preferences)
+        engine = scoring_engine_for(preferences)
         scored = engine.score_all(listings)
         
-        # Check that no scored listing contains the reject keyword
+        # Check that no scored listing contains the reject keyword as a whole word
+        contains_reject = re.compile(rf'\b{re.escape(reject_keyword)}\b').search
         for scored_listing in scored:
-            searchable_text = f"{scored_listing.listing.title} {scored_listing.listing.description}".lower()
-            assert reject_keyword not in searchable_text, \
+            assert not contains_reject(scored_listing.listing.search_text), \
                 f"Scored listing should not contain reject keyword '{reject_keyword}'"
+    
+    @given(
+        listings=st.lists(job_listing_strategy(), min_size=1, max_size=_BATCH_MAX_LISTINGS),
+        reject_keyword=_UNEXPANDED_REJECT_KEYWORD,
+        planted=st.sets(st.integers(min_value=0, max_value=_BATCH_MAX_LISTINGS - 1)),
+        preferences=_REJECT_TEST_PREFS
+    )
+    def test_filter_rejected_matches_batch_reference(self, scoring_engine_for, listings, reject_keyword,
+                                                     planted, preferences):
+        """
+        **Feature: internhunt-v6, Property 4: Reject keyword filtering**
+        **Validates: Requirements 4.7**
+        
+        Test that the reject filter keeps exactly the listings the batch
+        reference does not flag, over lists larger than score_all tests use.
+        """
+        # Random text rarely contains the keyword, so append it to some titles
+        listings = [
+            dataclasses.replace(listing, title=f"{listing.title} {reject_keyword}") if i in planted else listing
+            for i, listing in enumerate(listings)
+        ]
+        
+        preferences = dataclasses.replace(preferences, reject_keywords=[reject_keyword])
+        engine = scoring_engine_for(preferences)
+        
+        rejected = _batch_reject_mask(listings, reject_keyword)
+        expected = [listing for listing, drop in zip(listings, rejected) if not drop]
+        
+        assert engine.filter_rejected(listings) == expected
 
 
 class TestWantedKeywordScoringConsistency:
     """
     Property 5: Wanted keyword scoring consistency
     
-    For any listing, the number of wanted keyword matches multiplied by 2
+    For any listing, the number of wanted keyword matches multiplied by 10
     should equal the keyword component of the total score.
     
     Validates: Requirements 4.1
     """
     
-    @settings(max_examples=100)
     @given(
-        wanted_keywords=st.lists(st.text(min_size=3, max_size=15, alphabet=st.characters(whitelist_categories=('L',))), min_size=1, max_size=10),
+        wanted_keywords=st.lists(_UNEXPANDED_WANTED_KEYWORD, min_size=1, max_size=10),
         listing=job_listing_strategy(),
-        preferences_data=st.data()
+        preferences=_NO_KEYWORD_PREFS
     )
-    def test_keyword_score_equals_matches_times_two(self, wanted_keywords, listing, preferences_data):
+    def test_keyword_score_equals_matches_times_ten(self, scoring_engine_for, wanted_keywords, listing, preferences):
         """
         **Feature: internhunt-v6, Property 5: Wanted keyword scoring consistency**
         **Validates: Requirements 4.1**
         
-        Test that keyword score equals (matches * 2).
+        Test that keyword score equals (matches * 10).
         """
-        # Normalize keywords
-        wanted_keywords = [kw.strip().lower() for kw in wanted_keywords if kw.strip()]
-        assume(len(wanted_keywords) > 0)
+        # Set the drawn wanted keywords on the keyword-free preferences
+        preferences = dataclasses.replace(preferences, wanted_keywords=wanted_keywords)
         
-        # Create preferences
-        preferences = preferences_data.draw(user_preferences_strategy(wanted_kw=wanted_keywords, reject_kw=[]))
+        # Guarantee at least one keyword match so the listing is never rejected
+        listing = dataclasses.replace(listing, title=f"{listing.title} {wanted_keywords[0]}")
         
         # Score the listing
-        engine = ScoringEngine(preferences)
+        engine = scoring_engine_for(preferences)
         result = engine.score_listing(listing)
         
-        # If listing was rejected for other reasons, skip
-        assume(result is not None)
+        assert result is not None
         
-        # Count actual keyword matches
-        searchable_text = f"{listing.title} {listing.description}".lower()
-        actual_matches = sum(1 for kw in wanted_keywords if kw in searchable_text)
+        # Count distinct keywords occurring as whole words; none have expansions
+        actual_matches = sum(
+            1 for kw in set(wanted_keywords)
+            if re.search(rf'\b{re.escape(kw)}\b', listing.search_text)
+        )
         
         # Verify keyword score
-        expected_keyword_score = actual_matches * 2.0
+        expected_keyword_score = actual_matches * 10.0
         assert result.score_breakdown['keyword'] == expected_keyword_score, \
             f"Keyword score should be {expected_keyword_score} (matches={actual_matches}), got {result.score_breakdown['keyword']}"
 
@@ -241,98 +358,43 @@ class TestRemoteDetectionAccuracy:
     Validates: Requirements 4.4, 10.1, 10.2, 10.3
     """
     
-    @settings(max_examples=100)
     @given(
         remote_indicator=st.sampled_from(['remote', 'wfh', 'work from home', 'work-from-home', 'pan india', 'pan-india', 'anywhere in india']),
         location_or_desc=st.sampled_from(['location', 'description']),
-        other_text=st.text(min_size=0, max_size=50),
-        preferences_data=st.data()
+        other_text=st.text(min_size=0, max_size=50)
     )
-    def test_remote_indicators_detected(self, remote_indicator, location_or_desc, other_text, preferences_data):
+    def test_remote_indicators_detected(self, scoring_engine_for, remote_indicator, location_or_desc, other_text):
         """
         **Feature: internhunt-v6, Property 6: Remote detection accuracy**
         **Validates: Requirements 4.4, 10.1, 10.2, 10.3**
         
         Test that remote indicators are detected in location or description.
         """
-        # Create preferences with remote preference = 'yes'
-        preferences = preferences_data.draw(user_preferences_strategy(remote_pref='yes', reject_kw=[]))
-        
-        # Create listing with remote indicator
-        if location_or_desc == 'location':
-            listing = JobListing(
-                title="Test Title",
-                company="Test Company",
-                stipend=10000,
-                location=f"{other_text} {remote_indicator} {other_text}",
-                description="Test description",
-                url="http://test.com",
-                posted_date="2024-01-01",
-                source_platform="Test",
-                raw_stipend_text="10000"
-            )
-        else:
-            listing = JobListing(
-                title="Test Title",
-                company="Test Company",
-                stipend=10000,
-                location="Test Location",
-                description=f"{other_text} {remote_indicator} {other_text}",
-                url="http://test.com",
-                posted_date="2024-01-01",
-                source_platform="Test",
-                raw_stipend_text="10000"
-            )
-        
-        # Score the listing
-        engine = ScoringEngine(preferences)
-        result = engine.score_listing(listing)
+        # Put the remote indicator in the location or description
+        fields = {'location': _LISTING_TEMPLATE.location, 'description': _LISTING_TEMPLATE.description}
+        fields[location_or_desc] = f"{other_text} {remote_indicator} {other_text}"
         
-        # If listing was rejected for other reasons, skip
-        assume(result is not None)
+        # Call the detector directly; the 5-point remote score is covered by the golden table
+        engine = scoring_engine_for(_REMOTE_PREFS)
         
-        # Remote score should be 5.0
-        assert result.score_breakdown['remote'] == 5.0, \
-            f"Remote indicator '{remote_indicator}' should be detected and score 5.0, got {result.score_breakdown['remote']}"
+        assert engine._detect_remote(**fields) is True, \
+            f"Remote indicator '{remote_indicator}' should be detected in {location_or_desc}"
     
-    @settings(max_examples=100)
     @given(
-        remote_indicator=st.sampled_from(['REMOTE', 'WFH', 'Work From Home', 'WORK-FROM-HOME', 'Pan India', 'PAN-INDIA']),
-        preferences_data=st.data()
+        remote_indicator=st.sampled_from(['REMOTE', 'WFH', 'Work From Home', 'WORK-FROM-HOME', 'Pan India', 'PAN-INDIA'])
     )
-    def test_remote_detection_case_insensitive(self, remote_indicator, preferences_data):
+    def test_remote_detection_case_insensitive(self, scoring_engine_for, remote_indicator):
         """
         **Feature: internhunt-v6, Property 6: Remote detection accuracy**
         **Validates: Requirements 4.4, 10.1, 10.2, 10.3**
         
         Test that remote detection is case-insensitive.
         """
-        # Create preferences with remote preference = 'yes'
-        preferences = preferences_data.draw(user_preferences_strategy(remote_pref='yes', reject_kw=[]))
-        
-        # Create listing with uppercase/mixed case remote indicator
-        listing = JobListing(
-            title="Test Title",
-            company="Test Company",
-            stipend=10000,
-            location=remote_indicator,
-            description="Test description",
-            url="http://test.com",
-            posted_date="2024-01-01",
-            source_platform="Test",
-            raw_stipend_text="10000"
-        )
-        
-        # Score the listing
-        engine = ScoringEngine(preferences)
-        result = engine.score_listing(listing)
+        engine = scoring_engine_for(_REMOTE_PREFS)
         
-        # If listing was rejected for other reasons, skip
-        assume(result is not None)
-        
-        # Remote score should be 5.0
-        assert result.score_breakdown['remote'] == 5.0, \
-            f"Remote indicator '{remote_indicator}' should be detected (case-insensitive), got {result.score_breakdown['remote']}"
+        # Uppercase/mixed case remote indicator as the location
+        assert engine._detect_remote(remote_indicator, _LISTING_TEMPLATE.description) is True, \
+            f"Remote indicator '{remote_indicator}' should be detected (case-insensitive)"
 
 
 class TestStipendScoringMonotonicity:
@@ -346,13 +408,14 @@ class TestStipendScoringMonotonicity:
     Validates: Requirements 4.3
     """
     
-    @settings(max_examples=100)
+    # target() below spreads examples across stipend gaps, so fewer examples suffice
+    @settings(max_examples=30)
     @given(
         stipend1=st.integers(min_value=1000, max_value=100000),
         stipend2=st.integers(min_value=1000, max_value=100000),
-        preferences_data=st.data()
+        preferences=_NO_KEYWORD_PREFS
     )
-    def test_higher_stipend_gets_higher_or_equal_score(self, stipend1, stipend2, preferences_data):
+    def test_higher_stipend_gets_higher_or_equal_score(self, scoring_engine_for, stipend1, stipend2, preferences):
         """
         **Feature: internhunt-v6, Property 7: Stipend scoring monotonicity**
         **Validates: Requirements 4.3**
@@ -365,42 +428,31 @@ class TestStipendScoringMonotonicity:
         
         assume(stipend1 > stipend2)
         
+        # Steer generation toward wide gaps, where the higher stipend reaches the score cap
+        target(float(stipend1 - stipend2), label="stipend_gap")
+        
         # Create preferences with min_stipend below both
         min_stipend = min(stipend1, stipend2) - 1000
-        preferences = preferences_data.draw(user_preferences_strategy(min_stip=max(0, min_stipend), reject_kw=[]))
+        preferences = dataclasses.replace(preferences, min_stipend=max(0, min_stipend))
         
         # Create two listings with different stipends
-        listing1 = JobListing(
-            title="Test Title 1",
-            company="Test Company",
-            stipend=stipend1,
-            location="Test Location",
-            description="Test description",
-            url="http://test.com/1",
-            posted_date="2024-01-01",
-            source_platform="Test",
-            raw_stipend_text=str(stipend1)
+        listing1 = dataclasses.replace(
+            _LISTING_TEMPLATE, title="Test Title 1", stipend=stipend1,
+            url="http://test.com/1", raw_stipend_text=str(stipend1)
         )
         
-        listing2 = JobListing(
-            title="Test Title 2",
-            company="Test Company",
-            stipend=stipend2,
-            location="Test Location",
-            description="Test description",
-            url="http://test.com/2",
-            posted_date="2024-01-01",
-            source_platform="Test",
-            raw_stipend_text=str(stipend2)
+        listing2 = dataclasses.replace(
+            _LISTING_TEMPLATE, title="Test Title 2", stipend=stipend2,
+            url="http://test.com/2", raw_stipend_text=str(stipend2)
         )
         
         # Score both listings
-        engine = ScoringEngine(preferences)
+        engine = scoring_engine_for(preferences)
         result1 = engine.score_listing(listing1)
         result2 = engine.score_listing(listing2)
         
-        # If either was rejected, skip
-        assume(result1 is not None and result2 is not None)
+        # No wanted or reject keywords, so neither listing can be rejected
+        assert result1 is not None and result2 is not None
         
         # Stipend score for listing1 should be >= listing2
         assert result1.score_breakdown['stipend'] >= result2.score_breakdown['stipend'], \
@@ -417,29 +469,25 @@ class TestScoreBasedSorting:
     Validates: Requirements 4.8
     """
     
-    @settings(max_examples=100)
     @given(
         listings=st.lists(job_listing_strategy(), min_size=2, max_size=20),
-        preferences_data=st.data()
+        preferences=_NO_KEYWORD_PREFS
     )
-    def test_score_all_returns_descending_order(self, listings, preferences_data):
+    def test_score_all_returns_descending_order(self, scoring_engine_for, listings, preferences):
         """
         **Feature: internhunt-v6, Property 8: Score-based sorting**
         **Validates: Requirements 4.8**
         
         Test that score_all returns listings in descending score order.
         """
-        # Create preferences
-        preferences = preferences_data.draw(user_preferences_strategy(reject_kw=[]))
-        
         # Score all listings
-        engine = ScoringEngine(preferences)
+        engine = scoring_engine_for(preferences)
         scored = engine.score_all(listings)
         
-        # Need at least 2 scored listings to check ordering
-        assume(len(scored) >= 2)
+        # Nothing can be rejected, so every listing is scored
+        assert len(scored) == len(listings)
         
-        # Check that scores are in descending order
-        for i in range(len(scored) - 1):
-            assert scored[i].score >= scored[i + 1].score, \
-                f"Scores should be in descending order: {scored[i].score} >= {scored[i + 1].score}"
+        # Check that scores are in descending order (one C-level list comparison)
+        scores = [s.score for s in scored]
+        assert scores == sorted(scores, reverse=True), \
+            f"Scores should be in descending order: {scores}"
